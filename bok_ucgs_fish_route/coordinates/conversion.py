@@ -2,7 +2,8 @@
 Utility functions for coordinate conversion between different coordinate systems.
 """
 import logging
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Tuple, Optional, Union
 import pyproj
 
 # Configure logging
@@ -34,9 +35,52 @@ def get_utm_zone_for_coordinates(lon: float, lat: float) -> int:
     """
     # UTM zones are 6 degrees wide
     # Zone 1 starts at -180 degrees longitude
-    zone = int((lon + 180) / 6) + 1
+    # (the 180th meridian belongs to zone 60, not to a 61st zone)
+    zone = min(int((lon + 180) / 6) + 1, 60)
     return zone
 
+def parse_utm_zone(utm: str) -> Tuple[int, bool]:
+    """
+    Parse a UTM zone string such as "34N" or "34s" into its zone number and hemisphere.
+
+    Args:
+        utm (str): UTM zone number followed by its hemisphere letter (N or S)
+
+    Returns:
+        Tuple[int, bool]: (zone number, True if the zone is in the northern hemisphere)
+    """
+    hemisphere = utm[-1].upper()
+    zone_number = int(utm[:-1]) if hemisphere in ('N', 'S') else int(utm)
+    return zone_number, hemisphere == 'N'
+
+def get_utm_epsg_code(zone: int, north: bool) -> int:
+    """
+    Get the EPSG code of a WGS84 / UTM zone.
+
+    Args:
+        zone (int): UTM zone number
+        north (bool): True for the northern hemisphere, False for the southern one
+
+    Returns:
+        int: EPSG code (32600 + zone in the North, 32700 + zone in the South)
+    """
+    return (32600 if north else 32700) + zone
+
+@lru_cache(maxsize=128)
+def _get_wgs84_to_utm_transformer(zone: int, north: bool) -> pyproj.Transformer:
+    """
+    Build the WGS84 to UTM transformer for a zone, once per process.
+
+    Args:
+        zone (int): UTM zone number
+        north (bool): True for the northern hemisphere, False for the southern one
+
+    Returns:
+        pyproj.Transformer: Transformer from WGS84 (lon, lat) to UTM (easting, northing)
+    """
+    utm_proj_str = f"+proj=utm +zone={zone} {'+north' if north else '+south'} +ellps=WGS84 +datum=WGS84 +units=m +no_defs"
+    return pyproj.Transformer.from_crs("EPSG:4326", utm_proj_str, always_xy=True)
+
 def wgs84_to_utm(lon: float, lat: float) -> Tuple[float, float]:
     """
     Convert WGS84 coordinates (longitude, latitude) to UTM coordinates (easting, northing).
@@ -54,20 +98,36 @@ def wgs84_to_utm(lon: float, lat: float) -> Tuple[float, float]:
     # Determine if the coordinate is in the northern or southern hemisphere
     north = lat >= 0
     
-    # Create the UTM projection string
-    utm_proj_str = f"+proj=utm +zone={zone} {'+north' if north else '+south'} +ellps=WGS84 +datum=WGS84 +units=m +no_defs"
-    
-    # Create the transformer
-    transformer = pyproj.Transformer.from_crs("EPSG:4326", utm_proj_str, always_xy=True)
+    # Get the (cached) transformer for this zone
+    transformer = _get_wgs84_to_utm_transformer(zone, north)
     
     # Transform the coordinates
     easting, northing = transformer.transform(lon, lat)
     
     return easting, northing
 
+@lru_cache(maxsize=32)
+def get_transformer_to_wgs84(epsg_code: Union[str, int]) -> pyproj.Transformer:
+    """
+    Build a transformer from the given EPSG coordinate reference system to WGS84, once per EPSG code.
+
+    The code is the cache key as given: "32634" and 32634 are cached as separate entries.
+
+    Args:
+        epsg_code (str | int): EPSG code of the source coordinate reference system (e.g. "32634")
+
+    Returns:
+        pyproj.Transformer: Transformer from the source CRS (x, y) to WGS84 (lon, lat)
+    """
+    crs_source = pyproj.CRS.from_epsg(epsg_code)
+    crs_wgs84 = pyproj.CRS.from_epsg(4326)  # EPSG:4326 = WGS84
+    return pyproj.Transformer.from_crs(crs_source, crs_wgs84, always_xy=True)
+
 def convert_corners_from_wgs84_to_utm(corner1: Tuple[float, float], corner2: Tuple[float, float]) -> Tuple[Tuple[float, float], Tuple[float, float]]:
     """
     Check if the given corner coordinates are in WGS84 range and convert them to UTM if they are.
+
+    Both corners are converted in the UTM zone of the first one, so that they share a single referential.
     
     Args:
         corner1 (Tuple[float, float]): First corner coordinates as (x, y)
@@ -80,5 +140,66 @@ def convert_corners_from_wgs84_to_utm(corner1: Tuple[float, float], corner2: Tup
     """
     lon1, lat1 = corner1
     lon2, lat2 = corner2
+    if not (is_wgs84_coordinates(lon1, lat1) and is_wgs84_coordinates(lon2, lat2)):
+        return corner1, corner2
+
+    transformer = _get_wgs84_to_utm_transformer(get_utm_zone_for_coordinates(lon1, lat1), lat1 >= 0)
+    if corner1 == corner2:
+        utm_corner = transformer.transform(lon1, lat1)
+        return utm_corner, utm_corner
+    eastings, northings = transformer.transform([lon1, lon2], [lat1, lat2])
+
+    return (eastings[0], northings[0]), (eastings[1], northings[1])
+
+def extract_utm_corners_utm_epsg(
+        lat1: float,
+        lat2: float,
+        lon1: float,
+        lon2: float,
+        utm: Optional[str]
+) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], Tuple[float, float], int]:
+    """
+    Resolve the two corners given on the command line into UTM corners and the matching UTM EPSG code.
+
+    Args:
+        lat1 (float): Latitude (or northing if utm is set) of the first corner
+        lat2 (float): Latitude (or northing if utm is set) of the second corner
+        lon1 (float): Longitude (or easting if utm is set) of the first corner
+        lon2 (float): Longitude (or easting if utm is set) of the second corner
+        utm (Optional[str]): UTM zone (e.g. "34N") if the corners are already in UTM, None for WGS84
+
+    Returns:
+        Tuple: (corner1, corner2, utm_corner1, utm_corner2, utm_epsg), the corners as given and in UTM
+
+    Raises:
+        ValueError: If WGS84 corners are out of range
+    """
+    corner1 = (lon1, lat1)
+    corner2 = (lon2, lat2)
+    # Handle coordinates based on whether UTM zone is specified
+    if utm:
+        # Coordinates are in UTM
+        utm_corner1 = corner1
+        utm_corner2 = corner2
+
+        zone_number, north = parse_utm_zone(utm)
+        utm_epsg = get_utm_epsg_code(zone_number, north)
+
+        logger.info("Using UTM coordinates with zone %s (EPSG:%d): %s, %s", utm, utm_epsg, utm_corner1, utm_corner2)
+    else:
+        # Assume coordinates are in WGS84 and convert to UTM if needed
+        if not (-180 <= corner1[0] <= 180) or not (-180 <= corner2[0] <= 180):
+            raise ValueError("Longitude coordinates must be in the range [-180, 180] or set --utm parameter")
+        if not (-90 <= corner1[1] <= 90) or not (-90 <= corner2[1] <= 90):
+            raise ValueError("Latitude coordinates must be in the range [-90, 90] or set --utm parameter")
+        utm_corner1, utm_corner2 = convert_corners_from_wgs84_to_utm(corner1, corner2)
+
+        lon1, lat1 = corner1
+        zone_number = get_utm_zone_for_coordinates(lon1, lat1)
+        hemisphere = 'N' if lat1 >= 0 else 'S'
+
+        utm_epsg = get_utm_epsg_code(zone_number, hemisphere == 'N')
 
-    return wgs84_to_utm(lon1, lat1), wgs84_to_utm(lon2, lat2)
+        logger.info("Converted WGS84 coordinates to UTM zone %d%s (EPSG:%d): %s, %s",
+                    zone_number, hemisphere, utm_epsg, utm_corner1, utm_corner2)
+    return corner1, corner2, utm_corner1, utm_corner2, utm_epsg
@@ -2,8 +2,8 @@ from typing import List, Tuple
 
 from pyproj import Geod
 
+from bok_ucgs_fish_route.coordinates.conversion import get_transformer_to_wgs84
 from bok_ucgs_fish_route.coordinates.waypoint import WaypointCoordinate
-from pyproj import CRS, Transformer
 
 
 def add_water_entry_exit_segments(route_segment: 'RouteSegment', traveling_altitude: float) -> 'RouteSegment':
@@ -90,22 +90,22 @@ def create_route_segment_from_coordinates(
         RouteSegment: A route segment containing waypoints created from the coordinates
         
     Raises:
-        ValueError: If coordinates list is empty
+        ValueError: If coordinates list is empty or speed is not positive
     """
     if not coordinates:
         raise ValueError("Coordinates list must not be empty")
-
-    crs_utm = CRS.from_epsg(utm_epsg)
-    crs_wgs84 = CRS.from_epsg(4326)  # EPSG:4326 = WGS84
+    # Fail before converting any coordinate rather than in RouteSegment
+    if float(speed) <= 0:
+        raise ValueError("Speed must be positive")
 
     # Set up transformer from UTM to WGS84
-    transformer = Transformer.from_crs(crs_utm, crs_wgs84, always_xy=True)
+    transformer = get_transformer_to_wgs84(utm_epsg)
 
-    # Convert each coordinate tuple to a WaypointCoordinate
-    waypoints = []
-    for coord in coordinates:
-        lon, lat = transformer.transform(coord[0], coord[1])
-        waypoints.append(WaypointCoordinate(lon=lon, lat=lat, altitude=altitude))
+    # Convert all the coordinates in a single call, then build the WaypointCoordinates
+    xs = [coord[0] for coord in coordinates]
+    ys = [coord[1] for coord in coordinates]
+    lons, lats = transformer.transform(xs, ys)
+    waypoints = [WaypointCoordinate(lon=lon, lat=lat, altitude=altitude) for lon, lat in zip(lons, lats)]
 
     # Create and return a RouteSegment
     return RouteSegment(waypoints, speed)
@@ -120,6 +120,8 @@ class RouteSegment:
         speed (float): Speed in meters per second
     """
 
+    __slots__ = ('waypoints', 'speed')
+
     def __init__(self, waypoints: List[WaypointCoordinate], speed: float):
         """
         Initialize a RouteSegment.
@@ -8,6 +8,9 @@ class WaypointCoordinate:
         altitude (float): Altitude in meters
     """
 
+    # Routes hold one instance per point: no per-instance __dict__
+    __slots__ = ('lon', 'lat', 'altitude')
+
     def __init__(self, lon, lat, altitude=0.0):
         """
         Initialize a WaypointCoordinate.
@@ -1,4 +1,13 @@
 """
 Package for exporting route data to various formats.
 """
-from bok_ucgs_fish_route.exporter.map_exporter import export_route_segment_to_png
\ No newline at end of file
+
+__all__ = ['export_route_segment_to_png']
+
+
+def __getattr__(name):
+    # The map exporter pulls in matplotlib, geopandas and contextily: only import it when asked for
+    if name == 'export_route_segment_to_png':
+        from bok_ucgs_fish_route.exporter.map_exporter import export_route_segment_to_png
+        return export_route_segment_to_png
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
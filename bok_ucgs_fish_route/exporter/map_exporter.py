@@ -4,7 +4,7 @@ Module for exporting route segments to map images.
 import matplotlib.pyplot as plt
 import contextily as ctx
 import geopandas as gpd
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString, Point, Polygon
 import os
 from typing import Optional
 
@@ -58,8 +58,8 @@ def export_route_segment_to_png(
 
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
     # Extract coordinates from waypoints
     lons = [wp.lon for wp in route_segment.waypoints]
@@ -67,7 +67,7 @@ def export_route_segment_to_png(
 
     # Create a GeoDataFrame for the route line
     if len(route_segment) > 1:
-        line = LineString([(lon, lat) for lon, lat in zip(lons, lats)])
+        line = LineString(list(zip(lons, lats)))
         route_gdf = gpd.GeoDataFrame(geometry=[line], crs="EPSG:4326")
     else:
         # If there's only one waypoint, create a point
@@ -75,24 +75,15 @@ def export_route_segment_to_png(
         route_gdf = gpd.GeoDataFrame(geometry=[point], crs="EPSG:4326")
 
     # Create a GeoDataFrame for the waypoints
-    waypoints_gdf = gpd.GeoDataFrame(
-        geometry=[Point(lon, lat) for lon, lat in zip(lons, lats)],
-        crs="EPSG:4326"
-    )
-    waypoint_start = gpd.GeoDataFrame(
-        geometry=[Point(lon, lat) for lon, lat in zip([lons[0]], [lats[0]])],
-        crs="EPSG:4326"
-    )
-    waypoint_end = gpd.GeoDataFrame(
-        geometry=[Point(lon, lat) for lon, lat in zip([lons[-1]], [lats[-1]])],
-        crs="EPSG:4326"
-    )
+    waypoints_gdf = gpd.GeoDataFrame(geometry=gpd.points_from_xy(lons, lats), crs="EPSG:4326")
 
     # Reproject to the specified CRS
     route_gdf = route_gdf.to_crs(epsg=epsg_code)
     waypoints_gdf = waypoints_gdf.to_crs(epsg=epsg_code)
-    waypoint_start = waypoint_start.to_crs(epsg=epsg_code)
-    waypoint_end = waypoint_end.to_crs(epsg=epsg_code)
+
+    # The start and end markers are the first and last reprojected waypoints
+    waypoint_start = waypoints_gdf.iloc[[0]]
+    waypoint_end = waypoints_gdf.iloc[[-1]]
 
     # Create the plot
     fig, ax = plt.subplots(figsize=(width, height))
@@ -115,7 +106,6 @@ def export_route_segment_to_png(
         max_lat = max(corner1[1], corner2[1])
         
         # Create a GeoDataFrame for the rectangle
-        from shapely.geometry import Polygon
         rectangle = Polygon([
             (min_lon, min_lat),
             (max_lon, min_lat),
@@ -1,13 +1,25 @@
 import json
+import math
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from typing import List
+from typing import List, Optional, Tuple
+
+import pyproj
+
+from bok_ucgs_fish_route.coordinates.conversion import get_transformer_to_wgs84
 from bok_ucgs_fish_route.coordinates.route import RouteSegment
 
 
-def _load_from_json(filename: str) -> dict:
+@lru_cache(maxsize=8)
+def _read_template(filename: str) -> str:
     with open(filename, 'r') as fd:
-        return json.load(fd)
+        return fd.read()
+
+
+def _load_from_json(filename: str) -> dict:
+    # The file is read once per process, but every caller gets its own dict to fill in
+    return json.loads(_read_template(filename))
 
 
 def _route_segments_to_ucgs_segment(segments: list[RouteSegment]):
@@ -15,6 +27,34 @@ def _route_segments_to_ucgs_segment(segments: list[RouteSegment]):
     raise NotImplementedError
 
 
+def _segment_lons_lats(segment: RouteSegment, transformer: Optional[pyproj.Transformer]) -> Tuple[List[float], List[float]]:
+    """
+    Get the WGS84 longitudes and latitudes of a segment waypoints, transformed in a single call if needed.
+    """
+    lons = [waypoint.lon for waypoint in segment.waypoints]
+    lats = [waypoint.lat for waypoint in segment.waypoints]
+    if transformer is not None:
+        lons, lats = transformer.transform(lons, lats)
+    return lons, lats
+
+
+def _build_ucgs_waypoint(waypoint_template: dict, lon: float, lat: float, altitude: float, speed: float) -> dict:
+    """
+    Create a new UcGS waypoint from the template, with the WGS84 coordinates in radians and the segment speed.
+    """
+    return {
+        **waypoint_template,
+        "actions": list(waypoint_template["actions"]),
+        "point": {
+            **waypoint_template["point"],
+            "latitude": math.radians(lat),
+            "longitude": math.radians(lon),
+            "altitude": altitude,
+        },
+        "parameters": {**waypoint_template["parameters"], "speed": speed},
+    }
+
+
 def _route_segments_to_ucgs_route(segments: List[RouteSegment], epsg_code: str = "4326") -> dict:
     """
     Convert a list of route segments to a UcGS route structure.
@@ -26,43 +66,19 @@ def _route_segments_to_ucgs_route(segments: List[RouteSegment], epsg_code: str =
     Returns:
         dict: UcGS route structure
     """
-    import math
-    from pyproj import CRS, Transformer
-
     route_structure = _load_from_json('config/ucgs/route-structure.json')
-    route_waypoints = []
+    # Read the waypoint template once, each waypoint is then built from it
+    waypoint_template = _load_from_json('config/ucgs/waypoint.json')
 
     # Set up transformer if needed (if not WGS84)
-    if epsg_code != "4326":
-        crs_source = CRS.from_epsg(epsg_code)
-        crs_wgs84 = CRS.from_epsg(4326)  # WGS84
-        transformer = Transformer.from_crs(crs_source, crs_wgs84, always_xy=True)
-
-    for segment in segments:
-        for waypoint in segment.waypoints:
-            # Create a new waypoint from the template
-            ucgs_waypoint = _load_from_json('config/ucgs/waypoint.json')
-
-            # Get coordinates
-            lon, lat = waypoint.lon, waypoint.lat
-
-            # Transform coordinates if needed
-            if epsg_code != "4326":
-                lon, lat = transformer.transform(lon, lat)
-
-            # Convert coordinates to radians and set them
-            ucgs_waypoint["point"]["latitude"] = math.radians(lat)
-            ucgs_waypoint["point"]["longitude"] = math.radians(lon)
-            ucgs_waypoint["point"]["altitude"] = waypoint.altitude
-
-            # Set the speed from the segment
-            ucgs_waypoint["parameters"]["speed"] = segment.speed
-
-            # Add the waypoint to the list
-            route_waypoints.append(ucgs_waypoint)
+    transformer = get_transformer_to_wgs84(epsg_code) if epsg_code != "4326" else None
 
     # Add the waypoints to the route structure
-    route_structure["segments"] = route_waypoints
+    route_structure["segments"] = [
+        _build_ucgs_waypoint(waypoint_template, lon, lat, waypoint.altitude, segment.speed)
+        for segment in segments
+        for waypoint, lon, lat in zip(segment.waypoints, *_segment_lons_lats(segment, transformer))
+    ]
     return route_structure
 
 
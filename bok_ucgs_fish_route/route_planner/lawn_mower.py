@@ -11,12 +11,14 @@ def stitch_strips(
         turning_radius: float = None
 ) -> List[Tuple[float, float]]:
     coordinates = []
+    forward = True
     for i, strip in enumerate(strips):
         next_strip = strips[i + 1] if i < len(strips) - 1 else None
         if strip[1] is None:
             coordinates.append(strip[0])
+            forward = not forward
             continue
-        if i % 2 == 0:
+        if forward:
             coordinates.append(strip[0])
             coordinates.append(strip[1])
         else:
@@ -24,7 +26,7 @@ def stitch_strips(
             coordinates.append(strip[0])
         if next_strip and turning_radius:
             is_right = signed_distance_strips(strip, next_strip) > 0
-            if i % 2 == 0:
+            if forward:
                 if is_right:
                     coordinates.extend(add_circle_end_of_strips(strip, next_strip, clock_wise=True, min_point_distance=1))
                 else:
@@ -34,6 +36,7 @@ def stitch_strips(
                     coordinates.extend(add_circle_end_of_strips(reverse_strip(strip), reverse_strip(next_strip), clock_wise=False, min_point_distance=1))
                 else:
                     coordinates.extend(add_circle_end_of_strips(reverse_strip(strip), reverse_strip(next_strip), clock_wise=True, min_point_distance=1))
+        forward = not forward
     return coordinates
 
 
@@ -43,6 +46,7 @@ def extend_strips_perpendicular_ending(
     if len(strips) <= 1:
         return strips
     ret_strips = [((s[0][0], s[0][1]), None if s[1] is None else (s[1][0], s[1][1])) for s in strips]
+    forward = True
     for i in range(len(strips) - 1):
         strip_1 = ret_strips[i]
         strip_2 = ret_strips[i + 1]
@@ -52,7 +56,7 @@ def extend_strips_perpendicular_ending(
         end_point_2 = strip_2[0] if strip_2[1] is None else strip_2[1]
 
         # pushing ahead
-        if i % 2 == 0:
+        if forward:
             if is_perpendicular_ahead_of_strip(end_point_1, strip_2):
                 ret_strips[i + 1] = (strip_2[0], get_projection_point_on_strip(end_point_1, strip_2))
             elif is_perpendicular_ahead_of_strip(end_point_2, strip_1):
@@ -64,6 +68,7 @@ def extend_strips_perpendicular_ending(
                 ret_strips[i + 1] = (get_projection_point_on_strip(start_point_1, rev_strip_2), strip_2[1])
             elif is_perpendicular_ahead_of_strip(start_point_2, rev_strip_1):
                 ret_strips[i] = (get_projection_point_on_strip(start_point_2, rev_strip_1), strip_1[1])
+        forward = not forward
 
     return ret_strips
 
@@ -87,12 +92,13 @@ def add_circle_end_of_strips(
     alpha = 2 * math.asin(min_point_distance / radius)
     nb_sectors = math.ceil(math.pi / alpha)
     alpha_step = math.pi / nb_sectors
+    # The turn direction and the start angle do not change along the arc
+    signed_step = -alpha_step if clock_wise else alpha_step
+    start_angle = - diameter_angle
+    quarter_turn = math.pi / 2
     circle_coords = []
     for i in range(1, nb_sectors):
-        if clock_wise:
-            angle = - diameter_angle - (alpha_step * i) - math.pi / 2
-        else:
-            angle = - diameter_angle + (alpha_step * i) - math.pi / 2
+        angle = start_angle + signed_step * i - quarter_turn
 
         px = cx + radius * math.cos(angle)
         py = cy + radius * math.sin(angle)
@@ -264,22 +270,16 @@ def find_line_rectangle_intersections(
 
     intersects = []
 
-    # find each intersection with sideline and keep them if they are within the rectangle
-    x_y_min = find_horizontal_intersect(point, vector, y_min)
-    if x_y_min is not None and x_min <= x_y_min <= x_max:
-        intersects.append((x_y_min, y_min))
-
-    x_y_max = find_horizontal_intersect(point, vector, y_max)
-    if x_y_max is not None and x_min <= x_y_max <= x_max:
-        intersects.append((x_y_max, y_max))
-
-    y_x_min = find_vertical_intersect(point, vector, x_min)
-    if y_x_min is not None and y_min < y_x_min < y_max:
-        intersects.append((x_min, y_x_min))
-
-    y_x_max = find_vertical_intersect(point, vector, x_max)
-    if y_x_max is not None and y_min < y_x_max < y_max:
-        intersects.append((x_max, y_x_max))
+    # The edges are axis aligned: solve x on the horizontal ones and y on the vertical ones,
+    # and keep the intersections within the rectangle (corners are counted on the horizontal edges)
+    for y in (y_min, y_max):
+        x = find_horizontal_intersect(point, vector, y)
+        if x is not None and x_min <= x <= x_max:
+            intersects.append((x, y))
+    for x in (x_min, x_max):
+        y = find_vertical_intersect(point, vector, x)
+        if y is not None and y_min < y < y_max:
+            intersects.append((x, y))
     return intersects
 
 
@@ -314,16 +314,8 @@ def _create_lawn_mower_band_strips_utm(
     Returns:
         List[Tuple[float, float]]: List of coordinate tuples in the same format as the input
     """
-
-    # Define the rectangle corners in clockwise order (x, y) format
-    corners = [
-        (x_min, y_min),  # Bottom-left
-        (x_max, y_min),  # Bottom-right
-        (x_max, y_max),  # Top-right
-        (x_min, y_max),  # Top-left
-    ]
-
-    utm_coordinates = []
+    if angle % 90 == 0:
+        return _create_axis_aligned_band_strips_utm(x_min, x_max, y_min, y_max, band_distance, angle)
 
     center_x = (x_min + x_max) / 2
     center_y = (y_min + y_max) / 2
@@ -334,48 +326,43 @@ def _create_lawn_mower_band_strips_utm(
     dx = math.cos(line_angle_rad)
     dy = math.sin(line_angle_rad)
 
+    # (dx, dy) is the band line direction; strips are flown along the heading (0 is South->North),
+    # which is the same vector up to its sign, as the line angle is taken modulo 180
+    heading_sign = 1 if (90 - angle) % 360 < 180 else -1
+    heading_x = heading_sign * dx
+    heading_y = heading_sign * dy
+
+    # Calculate the band direction vector (perpendicular to the line direction)
+    band_dx = -dy
+    band_dy = dx
+
     width_meters = x_max - x_min
     height_meters = y_max - y_min
 
     # Calculate the projection of the rectangle onto the direction perpendicular to the bands
     # This gives us the maximum distance we need to cover with bands
-    projection_length = abs(width_meters * dx) + abs(height_meters * dy)
-
-    # Calculate the number of bands needed
-    num_bands = max(2, math.ceil(projection_length / band_distance) + 1)
+    projection_length = abs(width_meters * band_dx) + abs(height_meters * band_dy)
 
-    # Calculate the actual band distance in meters
-    actual_band_distance = projection_length / (num_bands - 1) if num_bands > 1 else projection_length
-
-    # Calculate the starting position for the first band
-    # We start from the furthest point in the negative direction perpendicular to the bands
-    start_offset = -projection_length / 2
-
-    # Calculate the band direction vector (perpendicular to the line direction)
-    band_dx = -dy
-    band_dy = dx
+    # The rectangle and the band direction are the same for every band
+    rectangle_corners = ((x_min, y_min), (x_max, y_max))
+    vector = (dx, dy)
 
     # Store all intersections to ensure we don't have duplicate waypoints
     all_strips = []
 
-    for i in range(num_bands):
-        # Calculate the offset for this band
-        offset = start_offset + i * actual_band_distance
+    for offset in _band_offsets(projection_length, band_distance):
         p_x = center_x + offset * band_dx
         p_y = center_y + offset * band_dy
 
-        intersects = find_line_rectangle_intersections(
-            ((x_min, y_min), (x_max, y_max)),
-            (p_x, p_y),
-            (dx, dy)
-        )
+        intersects = find_line_rectangle_intersections(rectangle_corners, (p_x, p_y), vector)
 
         if len(intersects) == 0:
             pass
         elif len(intersects) == 1:
             all_strips.append((intersects[0], None))
         elif len(intersects) == 2:
-            if abs((two_points_angle(intersects[0], intersects[1]) % 360 - (180 + angle) % 360)) < 1:
+            (x0, y0), (x1, y1) = intersects
+            if (x1 - x0) * heading_x + (y1 - y0) * heading_y < 0:
                 intersects = [intersects[1], intersects[0]]
             all_strips.append((intersects[0], intersects[1]))
         else:
@@ -384,6 +371,45 @@ def _create_lawn_mower_band_strips_utm(
     return all_strips
 
 
+def _create_axis_aligned_band_strips_utm(
+        x_min: float,
+        x_max: float,
+        y_min: float,
+        y_max: float,
+        band_distance: float,
+        angle: float
+) -> List[Tuple[Tuple[float, float], Tuple[float, float] | None]]:
+    """
+    Fast path of _create_lawn_mower_band_strips_utm when the heading is along the rectangle edges (angle multiple of 90).
+
+    The bands are laid out exactly as in the general path, but they are plain vertical (or horizontal) segments
+    from one edge to the opposite one, so they are emitted directly, without rotation and clipping.
+    """
+    heading_rad = math.radians(angle)
+    if angle % 180 == 0:
+        # Vertical bands from East to West, flown South->North (0) or North->South (180)
+        center_x = (x_min + x_max) / 2
+        start, end = (y_min, y_max) if math.cos(heading_rad) > 0 else (y_max, y_min)
+        return [((center_x - offset, start), (center_x - offset, end)) for offset in _band_offsets(x_max - x_min, band_distance)]
+
+    # Horizontal bands from South to North, flown West->East (90) or East->West (270)
+    center_y = (y_min + y_max) / 2
+    start, end = (x_min, x_max) if math.sin(heading_rad) > 0 else (x_max, x_min)
+    return [((start, center_y + offset), (end, center_y + offset)) for offset in _band_offsets(y_max - y_min, band_distance)]
+
+
+def _band_offsets(projection_length: float, band_distance: float) -> List[float]:
+    """
+    Offsets of the bands from the rectangle center, across the rectangle projection perpendicular to them.
+
+    The bands are evenly spaced strictly inside the rectangle, at most band_distance apart from each other
+    and from the outermost corners, so no band merely touches a corner or runs along an edge.
+    """
+    num_bands = max(1, math.ceil(projection_length / band_distance))
+    step = projection_length / (num_bands + 1)
+    return [-projection_length / 2 + (i + 1) * step for i in range(num_bands)]
+
+
 def reverse_strip(strip: Tuple[Tuple[float, float], Tuple[float, float] | None]) -> Tuple[Tuple[float, float], Tuple[float, float] | None]:
     if strip[1] is None:
         return strip
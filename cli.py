@@ -16,18 +16,36 @@ import tempfile
 import click
 from flask import Flask
 
-from bok_ucgs_fish_route.coordinates.conversion import convert_corners_from_wgs84_to_utm
+from bok_ucgs_fish_route.coordinates.conversion import extract_utm_corners_utm_epsg
 from bok_ucgs_fish_route.coordinates.route import create_route_segment_from_coordinates, add_water_entry_exit_segments, RouteSegment
 from bok_ucgs_fish_route.coordinates.waypoint import WaypointCoordinate
-from bok_ucgs_fish_route.exporter.map_exporter import export_route_segment_to_png
 from bok_ucgs_fish_route.exporter.ucgs_exporter import export_ucgs_json
 from bok_ucgs_fish_route.route_planner.lawn_mower import create_lawn_mower_band_strips, stitch_strips, extend_strips_perpendicular_ending, \
-    reorder_strips_turning_radius, add_circle_end_of_strips
+    reorder_strips_turning_radius
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def configure_logging():
+    """
+    Configure logging when a command runs rather than at import (basicConfig is a no-op once the root logger has handlers).
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+def configure_map_export():
+    """
+    Configure the map rendering when a command exports a map rather than when the exporter is imported.
+    """
+    import contextily as ctx
+    import matplotlib
+
+    # Maps are only written to files: use the non-interactive backend and skip the GUI backend probing
+    matplotlib.use("Agg")
+    # Keep the downloaded basemap tiles across runs: contextily deletes its per-session cache at exit
+    ctx.set_cache_dir(os.environ.get("CONTEXTILY_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "contextily")))
+
+
 app = Flask(__name__)
 
 
@@ -83,6 +101,8 @@ app = Flask(__name__)
 def generate_lawn_mowing(lon1, lat1, lon2, lat2, altitude, speed, turning_radius, band_width, angle, utm=None, epsg=None, route_name="to nowhere",
                          out_image=None,
                          out_ucgs=None):
+    configure_logging()
+
     # Create the corner coordinates
     corner1, corner2, utm_corner1, utm_corner2, utm_epsg = extract_utm_corners_utm_epsg(lat1, lat2, lon1, lon2, utm)
 
@@ -112,6 +132,9 @@ def generate_lawn_mowing(lon1, lat1, lon2, lat2, altitude, speed, turning_radius
         output_image_path = os.path.join(temp_dir, f"lawn_mower_map_{corner1[0]}_{corner1[1]}_{corner2[0]}_{corner2[1]}_{speed}_{band_width}.png")
 
     # Export the route segment to a PNG image
+    # (imported here, as matplotlib/geopandas/contextily are only needed by this command)
+    configure_map_export()
+    from bok_ucgs_fish_route.exporter.map_exporter import export_route_segment_to_png
     title = f"{route_name} (Speed: {speed} m/s, band delta: {band_width} m)"
     export_route_segment_to_png(
         route_segment=mowing_route_segment,
@@ -177,6 +200,8 @@ def generate_lawn_mowing(lon1, lat1, lon2, lat2, altitude, speed, turning_radius
 @click.option("--name", "route_name", type=str, help="route name (optional)", default="to nowhere")
 @click.option("--ucgs", "out_ucgs", type=str, help="output ucgs json file path (optional)")
 def generate_back_and_forth(lon1, lat1, lon2, lat2, altitude, speed, nb_times: int, utm, route_name, out_ucgs=None):
+    configure_logging()
+
     # Create the corner coordinates
     corner1, corner2, utm_corner1, utm_corner2, utm_epsg = extract_utm_corners_utm_epsg(lat1, lat2, lon1, lon2, utm)
 
@@ -193,55 +218,12 @@ def generate_back_and_forth(lon1, lat1, lon2, lat2, altitude, speed, nb_times: i
     )
     route_2_segments = add_water_entry_exit_segments(route_2, traveling_altitude=10)
 
-    route_seggments = []
     if nb_times == 0:
-        route_seggments.extend(route_1_segments)
+        route_segments = list(route_1_segments)
     else:
-        for _ in range(nb_times):
-            route_seggments.extend(route_1_segments)
-            route_seggments.extend(route_2_segments)
+        route_segments = (route_1_segments + route_2_segments) * nb_times
 
     if out_ucgs:
-        export_ucgs_json(route_seggments, out_ucgs, route_name=route_name, epsg_code='4326')
+        export_ucgs_json(route_segments, out_ucgs, route_name=route_name, epsg_code='4326')
         click.echo(f"Route exported to UCGS JSON file: {out_ucgs}")
 
-
-def extract_utm_corners_utm_epsg(lat1, lat2, lon1, lon2, utm):
-    corner1 = (lon1, lat1)
-    corner2 = (lon2, lat2)
-    # Handle coordinates based on whether UTM zone is specified
-    if utm:
-        # Coordinates are in UTM
-        utm_corner1 = corner1
-        utm_corner2 = corner2
-        was_converted = False
-
-        # Extract zone number and hemisphere from UTM string (e.g., "34N")
-        zone_number = int(utm.rstrip('NS'))
-        hemisphere = utm[-1].upper()
-        north = hemisphere == 'N'
-
-        # Compute EPSG code for the UTM zone
-        # UTM North zones: EPSG = 32600 + zone_number
-        # UTM South zones: EPSG = 32700 + zone_number
-        utm_epsg = 32600 + zone_number if north else 32700 + zone_number
-
-        logger.info(f"Using UTM coordinates with zone {utm} (EPSG:{utm_epsg}): {utm_corner1}, {utm_corner2}")
-    else:
-        # Assume coordinates are in WGS84 and convert to UTM if needed
-        if corner1[0] < -180 or corner1[0] > 180 or corner2[0] < -180 or corner2[0] > 180:
-            raise ValueError("Longitude coordinates must be in the range [-180, 180] or set --utm parameter")
-        if corner1[1] < -90 or corner1[1] > 90 or corner2[1] < -90 or corner2[1] > 90:
-            raise ValueError("Latitude coordinates must be in the range [-90, 90] or set --utm parameter")
-        utm_corner1, utm_corner2 = convert_corners_from_wgs84_to_utm(corner1, corner2)
-
-        lon1, lat1 = corner1
-        zone_number = int((lon1 + 180) / 6) + 1
-        hemisphere = 'N' if lat1 >= 0 else 'S'
-        utm_zone = f"{zone_number}{hemisphere}"
-
-        # Compute EPSG code for the UTM zone
-        utm_epsg = 32600 + zone_number if hemisphere == 'N' else 32700 + zone_number
-
-        logger.info(f"Converted WGS84 coordinates to UTM zone {utm_zone} (EPSG:{utm_epsg}): {utm_corner1}, {utm_corner2}")
-    return corner1, corner2, utm_corner1, utm_corner2, utm_epsg
@@ -7,8 +7,11 @@ import pytest
 from bok_ucgs_fish_route.coordinates.conversion import (
     is_wgs84_coordinates,
     get_utm_zone_for_coordinates,
+    get_utm_epsg_code,
+    parse_utm_zone,
     wgs84_to_utm,
-    convert_corners_from_wgs84_to_utm
+    convert_corners_from_wgs84_to_utm,
+    extract_utm_corners_utm_epsg
 )
 
 
@@ -41,12 +44,42 @@ class TestGetUtmZoneForCoordinates:
         (-9, 40, 29),
         (177, -30, 60),
         (-177, 30, 1),
+        (180, 0, 60),
+        (-180, 0, 1),
     ])
     def test_get_utm_zone(self, lon, lat, expected_zone):
         """Test that the function returns the correct UTM zone."""
         assert get_utm_zone_for_coordinates(lon, lat) == expected_zone
 
 
+class TestParseUtmZone:
+    """Tests for the parse_utm_zone function."""
+
+    @pytest.mark.parametrize("utm,expected", [
+        ("34N", (34, True)),
+        ("34S", (34, False)),
+        ("5n", (5, True)),
+        ("60s", (60, False)),
+    ])
+    def test_parse_utm_zone(self, utm, expected):
+        """Test that the zone number and the hemisphere are extracted."""
+        assert parse_utm_zone(utm) == expected
+
+
+class TestGetUtmEpsgCode:
+    """Tests for the get_utm_epsg_code function."""
+
+    @pytest.mark.parametrize("zone,north,expected_epsg", [
+        (34, True, 32634),
+        (34, False, 32734),
+        (1, True, 32601),
+        (60, False, 32760),
+    ])
+    def test_get_utm_epsg_code(self, zone, north, expected_epsg):
+        """Test that the function returns the WGS84 / UTM EPSG code of the zone."""
+        assert get_utm_epsg_code(zone, north) == expected_epsg
+
+
 class TestWgs84ToUtm:
     """Tests for the wgs84_to_utm function."""
 
@@ -92,3 +125,66 @@ class TestConvertCornersIfWgs84(TestCase):
         self.assertAlmostEqual(utm_corner1[1], 4144491.15, delta=0.01)
         self.assertAlmostEqual(utm_corner2[0], 697402.690, delta=0.01)
         self.assertAlmostEqual(utm_corner2[1], 4155792.687, delta=0.01)
+
+    def test_convert_identical_corners(self):
+        """Test that identical corners are converted to the same UTM point."""
+        utm_corner1, utm_corner2 = convert_corners_from_wgs84_to_utm((23.134, 37.428), (23.134, 37.428))
+
+        self.assertEqual(utm_corner1, utm_corner2)
+        self.assertAlmostEqual(utm_corner1[0], 688816.90, delta=0.01)
+        self.assertAlmostEqual(utm_corner1[1], 4144491.15, delta=0.01)
+
+    def test_keep_non_wgs84_corners(self):
+        """Test that corners out of the WGS84 range are returned as is."""
+        corner1 = (500000, 4000000)
+        corner2 = (500100, 4000100)
+
+        self.assertEqual(convert_corners_from_wgs84_to_utm(corner1, corner2), (corner1, corner2))
+
+    def test_convert_wgs84_corners_across_zones(self):
+        """Test that corners on both sides of a zone boundary are converted in the zone of the first one."""
+        corner1 = (23.99, 37.4)
+        corner2 = (24.01, 37.5)
+
+        utm_corner1, utm_corner2 = convert_corners_from_wgs84_to_utm(corner1, corner2)
+
+        # 24.01 lies in zone 35, but converted in zone 34 it stays about 1.4 km east of the first corner
+        self.assertAlmostEqual(utm_corner1[0], 764670.145, delta=0.01)
+        self.assertAlmostEqual(utm_corner2[0], 766086.088, delta=0.01)
+        self.assertAlmostEqual(utm_corner2[1], 4154598.411, delta=0.01)
+
+
+class TestExtractUtmCornersUtmEpsg:
+    """Tests for the extract_utm_corners_utm_epsg function."""
+
+    def test_utm_corners_are_kept(self):
+        """Test that corners given in UTM are passed through with the zone EPSG code."""
+        corner1, corner2, utm_corner1, utm_corner2, utm_epsg = extract_utm_corners_utm_epsg(
+            4000000, 4000100, 500000, 500100, "34N"
+        )
+
+        assert utm_corner1 == corner1 == (500000, 4000000)
+        assert utm_corner2 == corner2 == (500100, 4000100)
+        assert utm_epsg == 32634
+
+    def test_wgs84_corners_are_converted(self):
+        """Test that WGS84 corners are converted to UTM in the zone of the first corner."""
+        corner1, corner2, utm_corner1, utm_corner2, utm_epsg = extract_utm_corners_utm_epsg(
+            37.428, 37.528, 23.134, 23.234, None
+        )
+
+        assert corner1 == (23.134, 37.428)
+        assert utm_corner1 == pytest.approx((688816.90, 4144491.15), abs=0.01)
+        assert utm_corner2 == pytest.approx((697402.690, 4155792.687), abs=0.01)
+        assert utm_epsg == 32634
+
+    @pytest.mark.parametrize("lat1,lat2,lon1,lon2", [
+        (37.4, 37.5, 181, 23.2),
+        (37.4, 37.5, 23.1, -181),
+        (91, 37.5, 23.1, 23.2),
+        (37.4, -91, 23.1, 23.2),
+    ])
+    def test_wgs84_out_of_range(self, lat1, lat2, lon1, lon2):
+        """Test that out of range WGS84 corners are rejected."""
+        with pytest.raises(ValueError):
+            extract_utm_corners_utm_epsg(lat1, lat2, lon1, lon2, None)
@@ -143,4 +143,10 @@ def test_create_route_segment_from_coordinates_empty_list():
 def test_create_route_segment_from_coordinates_invalid_speed():
     """Test that create_route_segment_from_coordinates raises ValueError when given a non-positive speed."""
     with pytest.raises(ValueError, match="Speed must be positive"):
-        create_route_segment_from_coordinates([(23.1344738, 37.4285837)], 0.0, 0.0, "32634")
\ No newline at end of file
+        create_route_segment_from_coordinates([(23.1344738, 37.4285837)], 0.0, 0.0, "32634")
+
+
+def test_create_route_segment_from_coordinates_invalid_speed_before_conversion():
+    """Test that the speed is checked before setting up any coordinate conversion (the EPSG code is not used)."""
+    with pytest.raises(ValueError, match="Speed must be positive"):
+        create_route_segment_from_coordinates([(688857.37, 4144556.90)], 0.0, -1.0, "")
@@ -63,3 +63,12 @@ def test_waypoint_coordinate_repr():
 
     # The string representation should contain all the values
     assert str(waypoint) == expected_repr
+
+
+def test_waypoint_coordinate_has_no_dict():
+    """Test that waypoints only carry their coordinates (no per-instance __dict__)."""
+    waypoint = WaypointCoordinate(-74.0060, 40.7128, 10.0)
+
+    assert not hasattr(waypoint, '__dict__')
+    with pytest.raises(AttributeError):
+        waypoint.speed = 2.0
@@ -1,7 +1,6 @@
 """
 Tests for the map_exporter module.
 """
-import os
 import pytest
 from unittest.mock import patch, MagicMock
 import tempfile
@@ -115,13 +114,12 @@ class TestMapExporter:
         with pytest.raises(ValueError):
             RouteSegment([], 10.0)
 
-    @patch("bok_ucgs_fish_route.exporter.map_exporter.os.path.exists")
     @patch("bok_ucgs_fish_route.exporter.map_exporter.os.makedirs")
     @patch("bok_ucgs_fish_route.exporter.map_exporter.plt")
     @patch("bok_ucgs_fish_route.exporter.map_exporter.gpd")
     @patch("bok_ucgs_fish_route.exporter.map_exporter.ctx")
     def test_export_creates_directory(
-        self, mock_ctx, mock_gpd, mock_plt, mock_makedirs, mock_exists, 
+        self, mock_ctx, mock_gpd, mock_plt, mock_makedirs,
         sample_route_segment
     ):
         """Test that export_route_segment_to_png creates the output directory if needed."""
@@ -136,16 +134,12 @@ class TestMapExporter:
         mock_ax = MagicMock()
         mock_plt.subplots.return_value = (mock_fig, mock_ax)
         
-        # Mock os.path.exists to return False
-        mock_exists.return_value = False
-        
         # Call the function with a path that includes a directory
         output_path = "test_dir/test_output.png"
         export_route_segment_to_png(sample_route_segment, 3857, output_path)
         
         # Assertions
-        mock_exists.assert_called_with("test_dir")
-        mock_makedirs.assert_called_with("test_dir")
+        mock_makedirs.assert_called_with("test_dir", exist_ok=True)
         
     @patch("bok_ucgs_fish_route.exporter.map_exporter.plt")
     @patch("bok_ucgs_fish_route.exporter.map_exporter.gpd")
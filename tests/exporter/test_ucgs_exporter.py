@@ -1,12 +1,15 @@
+import copy
 import json
+import math
 import os
 import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 
+from bok_ucgs_fish_route.coordinates.conversion import get_transformer_to_wgs84
 from bok_ucgs_fish_route.coordinates.route import RouteSegment
 from bok_ucgs_fish_route.coordinates.waypoint import WaypointCoordinate
-from bok_ucgs_fish_route.exporter.ucgs_exporter import _route_segments_to_ucgs_route, export_ucgs_json
+from bok_ucgs_fish_route.exporter.ucgs_exporter import _route_segments_to_ucgs_route, export_ucgs_json, _load_from_json, _read_template
 
 
 class TestUcgsExporter(unittest.TestCase):
@@ -53,15 +56,31 @@ class TestUcgsExporter(unittest.TestCase):
             "route": None
         }
 
+    def _load_mock_json(self, filename):
+        # Return a new copy of the mocked template each time, as _load_from_json does
+        return copy.deepcopy({
+            'config/ucgs/route-structure.json': self.mock_route_structure,
+            'config/ucgs/waypoint.json': self.mock_waypoint
+        }[filename])
+
+    def test_load_from_json_reads_file_once(self):
+        _read_template.cache_clear()
+        try:
+            with patch('builtins.open', mock_open(read_data='{"point": {"latitude": null}}')) as mocked_open:
+                first = _load_from_json('config/ucgs/test.json')
+                second = _load_from_json('config/ucgs/test.json')
+
+            mocked_open.assert_called_once_with('config/ucgs/test.json', 'r')
+            # Each call still returns its own dict
+            first["point"]["latitude"] = 1.0
+            self.assertIsNone(second["point"]["latitude"])
+        finally:
+            _read_template.cache_clear()
+
     @patch('bok_ucgs_fish_route.exporter.ucgs_exporter._load_from_json')
     def test_route_segments_to_ucgs_route(self, mock_load_from_json):
         # Configure the mock to return our test data
-        # Use deepcopy to ensure a new object is returned each time
-        import copy
-        mock_load_from_json.side_effect = lambda filename: copy.deepcopy({
-                                                                             'config/ucgs/route-structure.json': self.mock_route_structure,
-                                                                             'config/ucgs/waypoint.json': self.mock_waypoint
-                                                                         }[filename])
+        mock_load_from_json.side_effect = self._load_mock_json
 
         # Call the function with our test segments
         result = _route_segments_to_ucgs_route([self.segment1, self.segment2])
@@ -71,7 +90,6 @@ class TestUcgsExporter(unittest.TestCase):
 
         # Check that all waypoints are present with correct values
         # Create sets of expected waypoints for easier comparison
-        import math
         expected_waypoints = [
             {
                 "latitude": math.radians(20.0),
@@ -109,6 +127,37 @@ class TestUcgsExporter(unittest.TestCase):
                     break
             self.assertTrue(found, f"Waypoint not found: {expected}")
 
+    @patch('bok_ucgs_fish_route.exporter.ucgs_exporter._load_from_json')
+    def test_route_segments_to_ucgs_route_loads_templates_once(self, mock_load_from_json):
+        mock_load_from_json.side_effect = self._load_mock_json
+
+        result = _route_segments_to_ucgs_route([self.segment1, self.segment2])
+
+        # One read per template, whatever the number of waypoints, and no waypoint shares its dicts
+        self.assertEqual(2, mock_load_from_json.call_count)
+        point_ids = {id(waypoint["point"]) for waypoint in result["segments"]}
+        self.assertEqual(3, len(point_ids))
+
+    @patch('bok_ucgs_fish_route.exporter.ucgs_exporter._load_from_json')
+    def test_route_segments_to_ucgs_route_from_utm(self, mock_load_from_json):
+        mock_load_from_json.side_effect = self._load_mock_json
+        utm_segment = RouteSegment([
+            WaypointCoordinate(lon=688857.37, lat=4144556.90, altitude=3.0),
+            WaypointCoordinate(lon=688868.36, lat=4144564.48, altitude=4.0),
+        ], speed=2.0)
+
+        result = _route_segments_to_ucgs_route([utm_segment], epsg_code="32634")
+
+        # Each waypoint is converted to WGS84 radians, in the segment order
+        transformer = get_transformer_to_wgs84("32634")
+        self.assertEqual(2, len(result["segments"]))
+        for waypoint, ucgs_waypoint in zip(utm_segment.waypoints, result["segments"]):
+            lon, lat = transformer.transform(waypoint.lon, waypoint.lat)
+            self.assertAlmostEqual(math.radians(lon), ucgs_waypoint["point"]["longitude"], places=12)
+            self.assertAlmostEqual(math.radians(lat), ucgs_waypoint["point"]["latitude"], places=12)
+            self.assertEqual(waypoint.altitude, ucgs_waypoint["point"]["altitude"])
+            self.assertEqual(2.0, ucgs_waypoint["parameters"]["speed"])
+
     @patch('bok_ucgs_fish_route.exporter.ucgs_exporter._load_from_json')
     @patch('bok_ucgs_fish_route.exporter.ucgs_exporter._route_segments_to_ucgs_route')
     def test_export_ucgs_json(self, mock_route_segments_to_ucgs_route, mock_load_from_json):
@@ -1,29 +1,36 @@
 import math
-from typing import Tuple, List
+from collections import Counter
 
 import pytest
 from pytest import approx
 
 from bok_ucgs_fish_route.coordinates.conversion import wgs84_to_utm
-from bok_ucgs_fish_route.coordinates.route import RouteSegment, create_route_segment_from_coordinates
+from bok_ucgs_fish_route.coordinates.route import create_route_segment_from_coordinates
 from bok_ucgs_fish_route.route_planner import create_lawn_mower_band_strips
 from bok_ucgs_fish_route.route_planner.lawn_mower import find_line_rectangle_intersections, find_horizontal_intersect, find_vertical_intersect, \
-    two_points_angle, stitch_strips, is_perpendicular_ahead_of_strip, get_projection_point_on_strip, distance_strips, signed_distance_strips, rearrange_index_shortest_path, \
+    two_points_angle, stitch_strips, extend_strips_perpendicular_ending, is_perpendicular_ahead_of_strip, get_projection_point_on_strip, distance_strips, signed_distance_strips, rearrange_index_shortest_path, \
     create_parallel_strip
 
+# Corners of the small survey rectangle shared by most cases, projected once
+UTM_SW_CORNER = wgs84_to_utm(23.134, 37.428)
+UTM_NE_CORNER = wgs84_to_utm(23.136, 37.430)
+
+# Rectangle shared by the line intersection cases
+RECTANGLE_CORNERS = ((0, 0), (10, 10))
+
 
 @pytest.mark.parametrize("corner1, corner2, speed, band_distance, angle", [
     # Test case 1: Small rectangle with horizontal bands (east-west)
     (
-            wgs84_to_utm(23.134, 37.428),  # corner1 (easting, northing) in UTM
-            wgs84_to_utm(23.136, 37.430),  # corner2 (easting, northing) in UTM
+            UTM_SW_CORNER,  # corner1 (easting, northing) in UTM
+            UTM_NE_CORNER,  # corner2 (easting, northing) in UTM
             2.5,  # speed
             50.0,  # band_distance in meters
             0.0,  # angle in degrees (South->North)
     ),
     # Test case 2: Rectangle with vertical bands (north-south)
     (
-            wgs84_to_utm(23.134, 37.428),  # corner1 (easting, northing) in UTM
+            UTM_SW_CORNER,  # corner1 (easting, northing) in UTM
             wgs84_to_utm(23.140, 37.430),  # corner2 (easting, northing) in UTM - wider rectangle
             1.0,  # speed
             50.0,  # band_distance in meters
@@ -39,29 +46,29 @@ from bok_ucgs_fish_route.route_planner.lawn_mower import find_line_rectangle_int
     ),
     # Test case 4: Horizontal bands with 90 degree angle (East->West)
     (
-            wgs84_to_utm(23.134, 37.428),  # corner1 (easting, northing) in UTM
-            wgs84_to_utm(23.136, 37.430),  # corner2 (easting, northing) in UTM
+            UTM_SW_CORNER,  # corner1 (easting, northing) in UTM
+            UTM_NE_CORNER,  # corner2 (easting, northing) in UTM
             2.5,  # speed
             50.0,  # band_distance in meters
             90.0,  # angle in degrees (East->West)
     ),
     # Test case 5: Diagonal bands with 45 degree angle
     (
-            wgs84_to_utm(23.134, 37.428),  # corner1 (easting, northing) in UTM
-            wgs84_to_utm(23.136, 37.430),  # corner2 (easting, northing) in UTM
+            UTM_SW_CORNER,  # corner1 (easting, northing) in UTM
+            UTM_NE_CORNER,  # corner2 (easting, northing) in UTM
             2.5,  # speed
             50.0,  # band_distance in meters
             45.0,  # angle in degrees (diagonal)
     ),
     # Test case 6: Diagonal bands with 30 degree angle
     (
-            wgs84_to_utm(23.134, 37.428),  # corner1 (easting, northing) in UTM
-            wgs84_to_utm(23.136, 37.430),  # corner2 (easting, northing) in UTM
+            UTM_SW_CORNER,  # corner1 (easting, northing) in UTM
+            UTM_NE_CORNER,  # corner2 (easting, northing) in UTM
             2.5,  # speed
             3.0,  # band_distance in meters
             30.0,  # angle in degrees (diagonal)
     ),
-])
+], ids=["south_north", "south_north_wide", "reversed_corners", "east_west", "diagonal_45", "diagonal_30_dense"])
 def test_create_lawn_mower_band_strips(corner1, corner2, speed, band_distance, angle):
     """
     Test that create_route_segment_lawn_mower correctly creates a route segment
@@ -72,19 +79,19 @@ def test_create_lawn_mower_band_strips(corner1, corner2, speed, band_distance, a
 
     assert len(strips) >= 2
 
-    # assert angle
+    # assert angle, against the same tolerance for every strip
+    expected_angle = approx(angle, abs=1.0)
     for p1, p2 in strips:
         if p2 is None:
             continue
-        got_angle = two_points_angle(p1, p2)
-        assert got_angle == approx(angle, abs=1.0)
+        assert two_points_angle(p1, p2) == expected_angle
 
 
 @pytest.mark.parametrize("angle", [0.0, 90.0])
 def test_lawn_mower_band_distance(angle):
     """Test that the distance between bands is at most the specified distance for standard angles."""
-    corner1 = wgs84_to_utm(23.134, 37.428)
-    corner2 = wgs84_to_utm(23.136, 37.430)
+    corner1 = UTM_SW_CORNER
+    corner2 = UTM_NE_CORNER
     band_distance = 50.0  # meters
     speed = 2.5
     strips = create_lawn_mower_band_strips(corner1, corner2, band_distance, angle)
@@ -120,6 +127,57 @@ def test_lawn_mower_band_distance(angle):
     assert len(route_segment.waypoints) <= expected_waypoints + 2
 
 
+@pytest.mark.parametrize("angle, expected_first, expected_last", [
+    (0.0, ((500100 - 100 / 11, 4000000), (500100 - 100 / 11, 4000100)), ((500000 + 100 / 11, 4000000), (500000 + 100 / 11, 4000100))),
+    (180.0, ((500100 - 100 / 11, 4000100), (500100 - 100 / 11, 4000000)), ((500000 + 100 / 11, 4000100), (500000 + 100 / 11, 4000000))),
+    (90.0, ((500000, 4000000 + 100 / 11), (500100, 4000000 + 100 / 11)), ((500000, 4000100 - 100 / 11), (500100, 4000100 - 100 / 11))),
+])
+def test_lawn_mower_axis_aligned_bands(angle, expected_first, expected_last):
+    """Test that headings along the rectangle edges cover it with evenly spaced bands, strictly inside the edges."""
+    strips = create_lawn_mower_band_strips((500000, 4000000), (500100, 4000100), 10.0, angle)
+
+    assert len(strips) == 10
+    assert strips[0] == (approx(expected_first[0]), approx(expected_first[1]))
+    assert strips[-1] == (approx(expected_last[0]), approx(expected_last[1]))
+    assert all(p2 is not None for _, p2 in strips)
+
+
+@pytest.mark.parametrize("angle, tilted_angle", [
+    (0.0, 0.001),
+    (0.0, 359.999),
+    (90.0, 89.999),
+    (90.0, 90.001),
+    (180.0, 179.999),
+])
+def test_lawn_mower_bands_consistent_around_axis_angles(angle, tilted_angle):
+    """Test that a heading slightly off a rectangle edge gives the same bands as the heading along the edge."""
+    corner1, corner2 = (500000, 4000000), (500500, 4000100)
+    band_distance = 20.0
+    strips = create_lawn_mower_band_strips(corner1, corner2, band_distance, angle)
+    tilted_strips = create_lawn_mower_band_strips(corner1, corner2, band_distance, tilted_angle)
+
+    # The tilt widens the rectangle projection by a few millimeters, which may add one band
+    # and tighten the spacing accordingly (here 500 / 20 and 100 / 20 are exact band counts)
+    assert abs(len(tilted_strips) - len(strips)) <= 1
+    assert all(p2 is not None for _, p2 in tilted_strips)
+    # Both cover the rectangle from one side to the other, flying the outermost bands the same way
+    # (the band order flips across 90, as the bands are numbered along the line angle modulo 180)
+    strips, tilted_strips = sorted(strips), sorted(tilted_strips)
+    for strip, tilted_strip in ((strips[0], tilted_strips[0]), (strips[-1], tilted_strips[-1])):
+        for point, tilted_point in zip(strip, tilted_strip):
+            assert tilted_point == (approx(point[0], abs=band_distance / 4), approx(point[1], abs=band_distance / 4))
+
+
+@pytest.mark.parametrize("angle", [30.0, 45.0, 60.0, 135.0])
+def test_lawn_mower_diagonal_bands_extend(angle):
+    """Test that diagonal bands never collapse to a corner, so they can all be extended and stitched."""
+    strips = create_lawn_mower_band_strips((500000, 4000000), (500100, 4000100), 10.0, angle)
+
+    assert all(p2 is not None and p1 != p2 for p1, p2 in strips)
+    coordinates = stitch_strips(extend_strips_perpendicular_ending(strips))
+    assert len(coordinates) >= 2 * len(strips)
+
+
 @pytest.mark.parametrize("point, vector, y, expected_x", [
     # Test case 1: parallel, out line
     (
@@ -221,42 +279,42 @@ def test_find_vertical_intersect(point, vector, x, expected_y):
 @pytest.mark.parametrize("rectangle_corners, point, vector, expected_intersections", [
     # Test case 1: Line passing through rectangle (2 intersections)
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (5, -5),  # point outside rectangle
             (0, 1),  # vector pointing north
             [(5, 0), (5, 10)]  # expected intersections (bottom and top)
     ),
     # Test case 2: Line passing through rectangle diagonally (2 intersections)
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (-5, -5),  # point outside rectangle
             (1, 1),  # vector pointing northeast
             [(0, 0), (10, 10)]  # expected intersections (bottom-left and top-right corners)
     ),
     # Test case 3: point on rectangle perimeter
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (0, 5),  # point on left edge
             (1, 0),  # vector pointing east
             [(0, 5), (10, 5)]  # expected intersection (right edge)
     ),
     # Test case 4: touching only one corner
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (5, 15),  # point on left edge
             (1, -1),  # vector pointing south east
             [(10, 10)]  # expected intersection (right edge)
     ),
     # Test case 5: Line missing rectangle (0 intersections)
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (20, 5),  # point outside rectangle
             (1, 1),  # vector pointing north east
             []  # no intersections
     ),
     # Test case 6: Line starting inside rectangle (1 intersection)
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (5, 5),  # point inside rectangle
             (1, 1),  # vector pointing northeast
             [(10, 10), (0, 0)]  # expected intersection (top-right corner)
@@ -264,7 +322,7 @@ def test_find_vertical_intersect(point, vector, x, expected_y):
     # Test case
     # 7: Line aligned to edge
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (-5, 10),  # point outside rectangle
             (-1, 0),  # vector pointing west
             []  # expected intersections (left and right edges)
@@ -272,7 +330,7 @@ def test_find_vertical_intersect(point, vector, x, expected_y):
     # Test case
     # 8: parallel to edge buzt missing it
     (
-            ((0, 0), (10, 10)),  # rectangle corners
+            RECTANGLE_CORNERS,  # rectangle corners
             (-5, 12),  # point outside rectangle
             (-1, 0),  # vector pointing west
             []  # expected intersections (left and right edges)
@@ -288,10 +346,8 @@ def test_find_line_rectangle_intersections(rectangle_corners, point, vector, exp
         assert intersections == []
         return
 
-    sorted_expected = sorted(expected_intersections, key=lambda p: (p[0], p[1]))
-    sorted_actual = sorted(intersections, key=lambda p: (p[0], p[1]))
-
-    assert sorted_actual == sorted_expected
+    # Points are (x, y) tuples, so the natural ordering already sorts by x then y
+    assert sorted(intersections) == sorted(expected_intersections)
 
 
 @pytest.mark.parametrize("point, strip, expected", [
@@ -542,9 +598,9 @@ def test_rearrange_index_shortest_path(n, lag):
     assert all(d <= 2*lag + 1 for d in dist)
 
     # all points in range are visited exactly once
+    visits = Counter(got)
     for i in range(n):
-        print(f'{i} -> {got.count(i)}')
-        assert got.count(i) == 1
+        assert visits[i] == 1, f'{i} -> {visits[i]}'
 
     # assert we add n too many extra points (one per pass except last one)
     got_extra = len([p for p in got if p < 0 or p >= n])
@@ -1,28 +1,99 @@
 """
 Tests for the Flask CLI application.
 """
-import os
-import sys
-from unittest.mock import patch
+from types import SimpleNamespace
 
+import click
 import pytest
 from flask.testing import FlaskCliRunner
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from cli import app
+from cli import app, generate_lawn_mowing
 from bok_ucgs_fish_route.coordinates.waypoint import WaypointCoordinate
 from bok_ucgs_fish_route.coordinates.route import RouteSegment
 
+# Output paths handed to the patched exporters, nothing is written there
+OUT_IMAGE = "route.png"
+OUT_UCGS = "route.json"
+MAP_GENERATED_MESSAGE = f"Map generated and saved to: {OUT_IMAGE}"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Fixture to provide a CLI runner for testing Flask CLI commands."""
+    """Fixture to provide a CLI runner for testing Flask CLI commands, shared by the whole session."""
     return FlaskCliRunner(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Fixture to provide a test client for the Flask app."""
+    """Fixture to provide a test client for the Flask app, shared by the whole session."""
     with app.test_client() as client:
         yield client
 
+
+@pytest.fixture
+def exporters(mocker):
+    """Fixture patching the map and UcGS exporters used by the CLI commands, and the map rendering setup."""
+    return SimpleNamespace(
+        configure=mocker.patch("cli.configure_map_export"),
+        png=mocker.patch("bok_ucgs_fish_route.exporter.map_exporter.export_route_segment_to_png"),
+        ucgs=mocker.patch("cli.export_ucgs_json"),
+    )
+
+
+@pytest.mark.parametrize("coordinates, utm_args", [
+    (["23.134", "37.428", "23.136", "37.430"], []),
+    (["500000", "4000000", "500100", "4000100"], ["--utm", "34N"]),
+], ids=["wgs84", "utm"])
+@pytest.mark.parametrize("angle", ["0.0", "45.0", "90.0"])
+def test_generate_lawn_mowing(cli_runner, exporters, coordinates, utm_args, angle):
+    """Test that generate-lawn-mowing plans a route and hands it to both exporters."""
+    result = cli_runner.invoke(args=[
+        "generate-lawn-mowing", *coordinates, "--band-width", "10", "--angle", angle, *utm_args,
+        "--image", OUT_IMAGE, "--ucgs", OUT_UCGS,
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert MAP_GENERATED_MESSAGE in result.output
+    exporters.configure.assert_called_once()
+    exporters.png.assert_called_once()
+    assert exporters.png.call_args.kwargs["output_path"] == OUT_IMAGE
+    mowing_route_segment = exporters.png.call_args.kwargs["route_segment"]
+    assert isinstance(mowing_route_segment, RouteSegment)
+    assert len(mowing_route_segment.waypoints) >= 4
+
+    exporters.ucgs.assert_called_once()
+    segments, output = exporters.ucgs.call_args.args
+    assert output == OUT_UCGS
+    assert mowing_route_segment in segments
+
+
+def test_generate_lawn_mowing_invalid_latitude(exporters):
+    """Test that out of range WGS84 corners are rejected before any export."""
+    # Only the raised error matters here, so the command callback is called without parsing a command line
+    with click.Context(generate_lawn_mowing), app.app_context(), pytest.raises(ValueError, match="Latitude"):
+        generate_lawn_mowing.callback(23.134, 97.428, 23.136, 37.430, altitude=4, speed=2, turning_radius=0, band_width=1, angle=0.0)
+
+    exporters.png.assert_not_called()
+    exporters.ucgs.assert_not_called()
+
+
+@pytest.mark.parametrize("nb_times, expected_scan_segments", [
+    (0, 1),
+    (1, 2),
+    (3, 6),
+])
+def test_generate_back_and_forth(cli_runner, exporters, nb_times, expected_scan_segments):
+    """Test that generate-back-and-forth repeats the crossing, alternating its direction."""
+    result = cli_runner.invoke(args=[
+        "generate-backand-forth", "23.134", "37.428", "23.136", "37.430",
+        "--altitude", "3", "--nb-times", str(nb_times), "--ucgs", OUT_UCGS,
+    ])
+
+    assert result.exit_code == 0, result.output
+    exporters.ucgs.assert_called_once()
+    segments = exporters.ucgs.call_args.args[0]
+    scan_segments = [segment for segment in segments if segment.waypoints[0].altitude == 3.0 and len(segment.waypoints) == 2]
+    assert len(scan_segments) == expected_scan_segments
+    assert scan_segments[0].waypoints == [WaypointCoordinate(23.134, 37.428, 3), WaypointCoordinate(23.136, 37.430, 3)]
+    if expected_scan_segments > 1:
+        assert scan_segments[1].waypoints == [WaypointCoordinate(23.136, 37.430, 3), WaypointCoordinate(23.134, 37.428, 3)]